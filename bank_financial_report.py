@@ -7,34 +7,107 @@ Integrasi langsung ke Excel dengan format profesional sesuai aturan akuntansi
 Version: 1.0.0
 """
 
-import argparse
+from __future__ import annotations
+
 import sys
 import os
+import warnings
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional
 from dataclasses import dataclass, field
 from enum import Enum
-import json
 
-# Excel imports
-from openpyxl import Workbook
-from openpyxl.styles import PatternFill, Font, Border, Side, Alignment, NamedStyle
-from openpyxl.utils import get_column_letter
-from openpyxl.formatting.rule import DataBarRule
+# Excel imports - openpyxl di-import saat generate laporan saja,
+# agar menu interaktif tidak menanggung waktu import-nya
+if TYPE_CHECKING:
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import PatternFill, Font, Alignment
+
+
+# Buffer file output laporan (2 MiB)
+_SAVE_BUFFER_SIZE = 2 * 1024 * 1024
+
+# Pemisah ribuan yang dibuang saat parsing input nominal
+_DIGIT_CLEAN = str.maketrans('', '', '.,')
+
+
+def _parse_rupiah(s: str) -> float:
+    """Parse input nominal Rupiah (contoh: 1.500.000) menjadi float"""
+    return float(s.translate(_DIGIT_CLEAN))
+
+
+# Banner & menu - dibuat sekali saat import, ditulis langsung ke stdout
+_BANNER = """
+╔══════════════════════════════════════════════════════════════════╗
+║                                                                  ║
+║           🏦 BANK FINANCIAL REPORT CLI TOOL 🏦                   ║
+║                                                                  ║
+║     Sistem Laporan Keuangan Bank dengan Integrasi Excel          ║
+║              Sesuai Standar Akuntansi Indonesia                  ║
+║                                                                  ║
+╚══════════════════════════════════════════════════════════════════╝
+
+"""
+
+_MAIN_MENU = """
+┌─────────────────────────────────────────────────────────────────┐
+│                      MENU UTAMA                                 │
+├─────────────────────────────────────────────────────────────────┤
+│  [1] Input Transaksi Baru                                       │
+│  [2] Lihat Daftar Transaksi                                     │
+│  [3] Edit Transaksi                                             │
+│  [4] Hapus Transaksi                                            │
+│  [5] Set Saldo Awal                                             │
+│  [6] Generate Laporan Keuangan (Excel)                          │
+│  [7] Setting Informasi Bank                                     │
+│  [0] Keluar                                                     │
+└─────────────────────────────────────────────────────────────────┘
+
+"""
+
+_TX_MENU = """
+┌─────────────────────────────────────────────────────────────────┐
+│                  PILIH JENIS TRANSAKSI                          │
+├─────────────────────────────────────────────────────────────────┤
+│  [1] Setoran Tunai                    (Kas ↑ | Modal ↑)        │
+│  [2] Penarikan Tunai                  (Kas ↓ | Modal ↓)        │
+│  [3] Transfer Masuk                   (Bank ↑ | Pendapatan ↑)    │
+│  [4] Transfer Keluar                  (Bank ↓ | Beban ↑)         │
+│  [5] Pembayaran Tagihan               (Kas/Bank ↓ | Hutang ↓)    │
+│  [6] Pembelian/Investasi              (Aset ↑ | Kas/Bank ↓)      │
+│  [7] Bunga Masuk                      (Bank ↑ | Pendapatan ↑)    │
+│  [8] Biaya Administrasi               (Beban ↑ | Bank ↓)         │
+│  [9] Pinjaman Masuk                   (Bank ↑ | Pinjaman ↑)      │
+│ [10] Angsuran Keluar                  (Pinjaman ↓ | Bank ↓)      │
+│  [0] Kembali ke Menu Utama                                      │
+└─────────────────────────────────────────────────────────────────┘
+
+"""
+
+# Format satu baris di view_transactions
+_ROW_FMT = "{id:<5} {date:<12} {type:<20} {desc:<25} Rp {amt:>12,.0f} {ref:<10}"
 
 
 class TransactionType(Enum):
-    """Jenis transaksi akuntansi"""
-    SETORAN_TUNAI = "Setoran Tunai"
-    PENARIKAN_TUNAI = "Penarikan Tunai"
-    TRANSFER_MASUK = "Transfer Masuk"
-    TRANSFER_KELUAR = "Transfer Keluar"
-    PEMBAYARAN_TAGIHAN = "Pembayaran Tagihan"
-    PEMBELIAN = "Pembelian/Investasi"
-    BUNGA_MASUK = "Bunga Masuk"
-    BIAYA_ADMIN = "Biaya Administrasi"
-    PINJAMAN_MASUK = "Pinjaman Masuk"
-    ANGSURAN_KELUAR = "Angsuran Keluar"
+    """Jenis transaksi akuntansi beserta akun debit/kredit-nya"""
+    SETORAN_TUNAI = ("Setoran Tunai", "Kas", "Modal")
+    PENARIKAN_TUNAI = ("Penarikan Tunai", "Modal", "Kas")
+    TRANSFER_MASUK = ("Transfer Masuk", "Bank", "Pendapatan Operasional")
+    TRANSFER_KELUAR = ("Transfer Keluar", "Beban Operasional", "Bank")
+    PEMBAYARAN_TAGIHAN = ("Pembayaran Tagihan", "Hutang", "Bank")
+    PEMBELIAN = ("Pembelian/Investasi", "Aset/Investasi", "Bank")
+    BUNGA_MASUK = ("Bunga Masuk", "Bank", "Pendapatan Bunga")
+    BIAYA_ADMIN = ("Biaya Administrasi", "Beban Administrasi", "Bank")
+    PINJAMAN_MASUK = ("Pinjaman Masuk", "Bank", "Pinjaman")
+    ANGSURAN_KELUAR = ("Angsuran Keluar", "Pinjaman", "Bank")
+    
+    def __new__(cls, label: str, debit: str, credit: str):
+        obj = object.__new__(cls)
+        obj._value_ = label
+        obj.debit = debit
+        obj.credit = credit
+        return obj
 
 
 class AccountType(Enum):
@@ -89,21 +162,71 @@ class FinancialData:
     beban_lain: float = 0.0
 
 
+@dataclass
+class Totals:
+    """Data class untuk total laporan, dihitung sekali per report"""
+    aset: float
+    kewajiban: float
+    ekuitas: float
+    pendapatan: float
+    beban: float
+    laba_rugi: float
+
+
 class BankFinancialReport:
     """Class utama untuk laporan keuangan bank"""
     
+    # Pilihan menu -> (jenis, efek saldo)
+    # Efek saldo: pasangan (field FinancialData, tanda) yang ditambah tanda * nominal
+    _TX_SPEC = {
+        '1': (TransactionType.SETORAN_TUNAI, (('kas', 1), ('modal', 1))),
+        '2': (TransactionType.PENARIKAN_TUNAI, (('kas', -1), ('modal', -1))),
+        '3': (TransactionType.TRANSFER_MASUK, (('bank_account', 1), ('pendapatan_lain', 1))),
+        '4': (TransactionType.TRANSFER_KELUAR, (('bank_account', -1), ('beban_lain', 1))),
+        '5': (TransactionType.PEMBAYARAN_TAGIHAN, (('hutang', -1), ('bank_account', -1))),
+        '6': (TransactionType.PEMBELIAN, (('investasi', 1), ('bank_account', -1))),
+        '7': (TransactionType.BUNGA_MASUK, (('bank_account', 1), ('pendapatan_bunga', 1))),
+        '8': (TransactionType.BIAYA_ADMIN, (('beban_admin', 1), ('bank_account', -1))),
+        '9': (TransactionType.PINJAMAN_MASUK, (('bank_account', 1), ('pinjaman', 1))),
+        '10': (TransactionType.ANGSURAN_KELUAR, (('pinjaman', -1), ('bank_account', -1))),
+    }
+    
     def __init__(self):
         self.data = FinancialData()
         self.transaction_counter = 0
-        self.setup_styles()
+        self._tx_by_id: Dict[int, Transaction] = {}
+        self._styles_ready = False
+        
+        # Pilihan menu utama -> handler
+        self._actions = {
+            '0': self._exit,
+            '1': self.input_transaction,
+            '2': self.view_transactions,
+            '3': self.edit_transaction,
+            '4': self.delete_transaction,
+            '5': self.set_initial_balance,
+            '6': self._generate_report_prompt,
+            '7': self.set_bank_info,
+        }
         
+    def _ensure_styles(self):
+        """Setup style Excel sekali, saat laporan pertama dibuat"""
+        if not self._styles_ready:
+            self.setup_styles()
+            self._styles_ready = True
+    
     def setup_styles(self):
         """Setup style untuk Excel"""
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import PatternFill, Font, Border, Side, Alignment, NamedStyle
+        
+        # Disimpan di instance agar _cell tidak import ulang untuk setiap cell
+        self._new_cell = WriteOnlyCell
+        
         # Colors - Professional Finance Style
         self.header_dark_blue = "1F4E79"
         self.header_light_blue = "2E75B6"
         self.accent_warm = "FFF3E0"
-        self.bg_light = "F5F5F5"
         self.text_dark = "000000"
         self.positive_green = "27AE60"
         self.negative_red = "E74C3C"
@@ -121,73 +244,74 @@ class BankFinancialReport:
                                        end_color=self.header_dark_blue, fill_type="solid")
         self.subheader_fill = PatternFill(start_color=self.header_light_blue, 
                                           end_color=self.header_light_blue, fill_type="solid")
-        self.alt_row_fill = PatternFill(start_color=self.bg_light, 
-                                        end_color=self.bg_light, fill_type="solid")
         self.highlight_fill = PatternFill(start_color=self.accent_warm, 
                                           end_color=self.accent_warm, fill_type="solid")
+        self.grand_total_fill = PatternFill(start_color="D4E6F1", end_color="D4E6F1", fill_type="solid")
+        self.laba_fill = PatternFill(start_color="D5F5E3", end_color="D5F5E3", fill_type="solid")
+        self.beban_fill = PatternFill(start_color="E74C3C", end_color="E74C3C", fill_type="solid")
         
         self.header_font = Font(color="FFFFFF", bold=True, size=11)
         self.title_font = Font(color=self.text_dark, bold=True, size=16)
         self.subtitle_font = Font(color=self.text_dark, bold=True, size=12)
         self.normal_font = Font(color=self.text_dark, size=10)
         self.currency_font = Font(color=self.text_dark, size=10)
+        self.total_font = Font(bold=True, size=11)
+        self.positive_font = Font(bold=True, size=11, color=self.positive_green)
+        self.negative_font = Font(bold=True, size=11, color=self.negative_red)
+        self.period_font = Font(size=11, color="666666")
+        self.note_font = Font(italic=True, size=10)
+        self.grand_total_label_font = Font(bold=True, size=12)
+        self.grand_total_font = Font(bold=True, size=12, color=self.header_dark_blue)
+        self.net_positive_font = Font(bold=True, size=12, color=self.positive_green)
+        self.net_negative_font = Font(bold=True, size=12, color=self.negative_red)
+        self.cover_title_font = Font(size=24, bold=True, color=self.header_dark_blue)
+        self.cover_bank_font = Font(size=20, bold=True, color=self.header_light_blue)
+        self.cover_period_font = Font(size=14, color="666666")
+        self.toc_font = Font(bold=True, size=10)
+        self.status_ok_font = Font(bold=True, color=self.positive_green)
+        self.status_error_font = Font(bold=True, color=self.negative_red)
         
         self.center_align = Alignment(horizontal='center', vertical='center')
         self.left_align = Alignment(horizontal='left', vertical='center')
         self.right_align = Alignment(horizontal='right', vertical='center')
+        
+        # Named styles - didaftarkan ke workbook sekali, dipakai via nama
+        self.named_styles = (
+            NamedStyle(name='header', font=self.header_font, fill=self.header_fill,
+                       alignment=self.center_align, border=self.thin_border),
+            NamedStyle(name='currency', font=self.currency_font,
+                       alignment=self.right_align, number_format='Rp #,##0.00'),
+            NamedStyle(name='currency_pos', font=self.positive_font,
+                       alignment=self.right_align, number_format='Rp #,##0.00'),
+            NamedStyle(name='currency_neg', font=self.negative_font,
+                       alignment=self.right_align, number_format='Rp #,##0.00'),
+            NamedStyle(name='total_highlight', font=self.total_font, fill=self.highlight_fill,
+                       alignment=self.right_align, number_format='Rp #,##0.00'),
+            NamedStyle(name='total_highlight_pos', font=self.positive_font, fill=self.highlight_fill,
+                       alignment=self.right_align, number_format='Rp #,##0.00'),
+            NamedStyle(name='total_highlight_neg', font=self.negative_font, fill=self.highlight_fill,
+                       alignment=self.right_align, number_format='Rp #,##0.00'),
+            NamedStyle(name='section', font=self.subtitle_font, fill=self.subheader_fill),
+            NamedStyle(name='section_beban', font=self.subtitle_font, fill=self.beban_fill),
+            NamedStyle(name='grand_total', font=self.grand_total_font, fill=self.grand_total_fill,
+                       alignment=self.right_align, number_format='Rp #,##0.00'),
+            NamedStyle(name='net_pos', font=self.net_positive_font, fill=self.laba_fill,
+                       alignment=self.right_align, number_format='Rp #,##0.00'),
+            NamedStyle(name='net_neg', font=self.net_negative_font, fill=self.laba_fill,
+                       alignment=self.right_align, number_format='Rp #,##0.00'),
+        )
     
     def show_banner(self):
         """Tampilkan banner aplikasi"""
-        banner = """
-╔══════════════════════════════════════════════════════════════════╗
-║                                                                  ║
-║           🏦 BANK FINANCIAL REPORT CLI TOOL 🏦                   ║
-║                                                                  ║
-║     Sistem Laporan Keuangan Bank dengan Integrasi Excel          ║
-║              Sesuai Standar Akuntansi Indonesia                  ║
-║                                                                  ║
-╚══════════════════════════════════════════════════════════════════╝
-        """
-        print(banner)
+        sys.stdout.write(_BANNER)
     
     def show_menu(self):
         """Tampilkan menu utama"""
-        menu = """
-┌─────────────────────────────────────────────────────────────────┐
-│                      MENU UTAMA                                 │
-├─────────────────────────────────────────────────────────────────┤
-│  [1] Input Transaksi Baru                                       │
-│  [2] Lihat Daftar Transaksi                                     │
-│  [3] Edit Transaksi                                             │
-│  [4] Hapus Transaksi                                            │
-│  [5] Set Saldo Awal                                             │
-│  [6] Generate Laporan Keuangan (Excel)                          │
-│  [7] Setting Informasi Bank                                     │
-│  [0] Keluar                                                     │
-└─────────────────────────────────────────────────────────────────┘
-        """
-        print(menu)
+        sys.stdout.write(_MAIN_MENU)
     
     def get_transaction_menu(self):
         """Menu pilihan jenis transaksi"""
-        menu = """
-┌─────────────────────────────────────────────────────────────────┐
-│                  PILIH JENIS TRANSAKSI                          │
-├─────────────────────────────────────────────────────────────────┤
-│  [1] Setoran Tunai                    (Kas ↑ | Modal ↑)        │
-│  [2] Penarikan Tunai                  (Kas ↓ | Modal ↓)        │
-│  [3] Transfer Masuk                   (Bank ↑ | Pendapatan ↑)    │
-│  [4] Transfer Keluar                  (Bank ↓ | Beban ↑)         │
-│  [5] Pembayaran Tagihan               (Kas/Bank ↓ | Hutang ↓)    │
-│  [6] Pembelian/Investasi              (Aset ↑ | Kas/Bank ↓)      │
-│  [7] Bunga Masuk                      (Bank ↑ | Pendapatan ↑)    │
-│  [8] Biaya Administrasi               (Beban ↑ | Bank ↓)         │
-│  [9] Pinjaman Masuk                   (Bank ↑ | Pinjaman ↑)      │
-│ [10] Angsuran Keluar                  (Pinjaman ↓ | Bank ↓)      │
-│  [0] Kembali ke Menu Utama                                      │
-└─────────────────────────────────────────────────────────────────┘
-        """
-        print(menu)
+        sys.stdout.write(_TX_MENU)
     
     def input_transaction(self):
         """Input transaksi baru"""
@@ -199,7 +323,7 @@ class BankFinancialReport:
             if choice == '0':
                 return
             
-            if choice not in [str(i) for i in range(1, 11)]:
+            if choice not in self._TX_SPEC:
                 print("❌ Pilihan tidak valid!")
                 return
             
@@ -216,9 +340,9 @@ class BankFinancialReport:
                 print("❌ Keterangan wajib diisi!")
                 return
             
-            amount_str = input("Nominal (Rp): ").strip().replace('.', '').replace(',', '')
+            amount_str = input("Nominal (Rp): ").strip()
             try:
-                amount = float(amount_str)
+                amount = _parse_rupiah(amount_str)
                 if amount <= 0:
                     print("❌ Nominal harus lebih dari 0!")
                     return
@@ -243,52 +367,12 @@ class BankFinancialReport:
         self.transaction_counter += 1
         trans_id = self.transaction_counter
         
-        transaction_map = {
-            '1': (TransactionType.SETORAN_TUNAI, "Kas", "Modal"),
-            '2': (TransactionType.PENARIKAN_TUNAI, "Modal", "Kas"),
-            '3': (TransactionType.TRANSFER_MASUK, "Bank", "Pendapatan Operasional"),
-            '4': (TransactionType.TRANSFER_KELUAR, "Beban Operasional", "Bank"),
-            '5': (TransactionType.PEMBAYARAN_TAGIHAN, "Hutang", "Bank"),
-            '6': (TransactionType.PEMBELIAN, "Aset/Investasi", "Bank"),
-            '7': (TransactionType.BUNGA_MASUK, "Bank", "Pendapatan Bunga"),
-            '8': (TransactionType.BIAYA_ADMIN, "Beban Administrasi", "Bank"),
-            '9': (TransactionType.PINJAMAN_MASUK, "Bank", "Pinjaman"),
-            '10': (TransactionType.ANGSURAN_KELUAR, "Pinjaman", "Bank"),
-        }
-        
-        trans_type, acc_debit, acc_credit = transaction_map[choice]
+        trans_type, effects = self._TX_SPEC[choice]
+        acc_debit, acc_credit = trans_type.debit, trans_type.credit
         
         # Update saldo berdasarkan jenis transaksi
-        if choice == '1':  # Setoran Tunai
-            self.data.kas += amount
-            self.data.modal += amount
-        elif choice == '2':  # Penarikan Tunai
-            self.data.kas -= amount
-            self.data.modal -= amount
-        elif choice == '3':  # Transfer Masuk
-            self.data.bank_account += amount
-            self.data.pendapatan_lain += amount
-        elif choice == '4':  # Transfer Keluar
-            self.data.bank_account -= amount
-            self.data.beban_lain += amount
-        elif choice == '5':  # Pembayaran Tagihan
-            self.data.hutang -= amount
-            self.data.bank_account -= amount
-        elif choice == '6':  # Pembelian/Investasi
-            self.data.investasi += amount
-            self.data.bank_account -= amount
-        elif choice == '7':  # Bunga Masuk
-            self.data.bank_account += amount
-            self.data.pendapatan_bunga += amount
-        elif choice == '8':  # Biaya Admin
-            self.data.beban_admin += amount
-            self.data.bank_account -= amount
-        elif choice == '9':  # Pinjaman Masuk
-            self.data.bank_account += amount
-            self.data.pinjaman += amount
-        elif choice == '10':  # Angsuran Keluar
-            self.data.pinjaman -= amount
-            self.data.bank_account -= amount
+        for attr, sign in effects:
+            setattr(self.data, attr, getattr(self.data, attr) + sign * amount)
         
         # Buat objek transaksi
         transaction = Transaction(
@@ -303,7 +387,7 @@ class BankFinancialReport:
             notes=notes
         )
         
-        self.data.transactions.append(transaction)
+        self.add_transaction(transaction)
         
         print("\n" + "=" * 60)
         print("✅ TRANSAKSI BERHASIL DISIMPAN")
@@ -318,6 +402,11 @@ class BankFinancialReport:
         print(f"No. Referensi   : {reference if reference else '-'}")
         print("=" * 60)
     
+    def add_transaction(self, transaction: Transaction):
+        """Simpan transaksi ke daftar dan index ID"""
+        self.data.transactions.append(transaction)
+        self._tx_by_id[transaction.id] = transaction
+    
     def view_transactions(self):
         """Lihat daftar transaksi"""
         if not self.data.transactions:
@@ -330,9 +419,12 @@ class BankFinancialReport:
         print(f"{'ID':<5} {'Tanggal':<12} {'Jenis Transaksi':<20} {'Keterangan':<25} {'Nominal':>15} {'Ref':<10}")
         print("-" * 100)
         
-        for t in self.data.transactions:
-            print(f"{t.id:<5} {t.date:<12} {t.transaction_type.value:<20} {t.description[:25]:<25} "
-                  f"Rp {t.amount:>12,.0f} {t.reference[:10]:<10}")
+        # Satu write untuk semua baris, bukan satu print per transaksi
+        fmt = _ROW_FMT.format
+        rows = [fmt(id=t.id, date=t.date, type=t.transaction_type.value,
+                    desc=t.description[:25], amt=t.amount, ref=t.reference[:10])
+                for t in self.data.transactions]
+        sys.stdout.write('\n'.join(rows) + '\n')
         
         print("-" * 100)
         print(f"Total Transaksi: {len(self.data.transactions)}")
@@ -347,7 +439,7 @@ class BankFinancialReport:
         
         try:
             trans_id = int(input("\nMasukkan ID transaksi yang akan diedit: "))
-            transaction = next((t for t in self.data.transactions if t.id == trans_id), None)
+            transaction = self._tx_by_id.get(trans_id)
             
             if not transaction:
                 print("❌ Transaksi tidak ditemukan!")
@@ -362,7 +454,7 @@ class BankFinancialReport:
             
             new_amount = input(f"Nominal [Rp {transaction.amount:,.0f}]: ").strip()
             if new_amount:
-                transaction.amount = float(new_amount.replace('.', '').replace(',', ''))
+                transaction.amount = _parse_rupiah(new_amount)
             
             new_ref = input(f"Referensi [{transaction.reference}]: ").strip()
             if new_ref:
@@ -382,7 +474,7 @@ class BankFinancialReport:
         
         try:
             trans_id = int(input("\nMasukkan ID transaksi yang akan dihapus: "))
-            transaction = next((t for t in self.data.transactions if t.id == trans_id), None)
+            transaction = self._tx_by_id.get(trans_id)
             
             if not transaction:
                 print("❌ Transaksi tidak ditemukan!")
@@ -391,6 +483,7 @@ class BankFinancialReport:
             confirm = input(f"Yakin hapus transaksi #{trans_id}? [y/N]: ").lower()
             if confirm == 'y':
                 self.data.transactions.remove(transaction)
+                del self._tx_by_id[trans_id]
                 print("✅ Transaksi berhasil dihapus!")
             else:
                 print("❌ Penghapusan dibatalkan.")
@@ -407,23 +500,23 @@ class BankFinancialReport:
         try:
             kas = input(f"Saldo Kas [Rp {self.data.kas:,.0f}]: ").strip()
             if kas:
-                self.data.kas = float(kas.replace('.', '').replace(',', ''))
+                self.data.kas = _parse_rupiah(kas)
             
             bank = input(f"Saldo Bank [Rp {self.data.bank_account:,.0f}]: ").strip()
             if bank:
-                self.data.bank_account = float(bank.replace('.', '').replace(',', ''))
+                self.data.bank_account = _parse_rupiah(bank)
             
             piutang = input(f"Piutang [Rp {self.data.piutang:,.0f}]: ").strip()
             if piutang:
-                self.data.piutang = float(piutang.replace('.', '').replace(',', ''))
+                self.data.piutang = _parse_rupiah(piutang)
             
             hutang = input(f"Hutang [Rp {self.data.hutang:,.0f}]: ").strip()
             if hutang:
-                self.data.hutang = float(hutang.replace('.', '').replace(',', ''))
+                self.data.hutang = _parse_rupiah(hutang)
             
             modal = input(f"Modal [Rp {self.data.modal:,.0f}]: ").strip()
             if modal:
-                self.data.modal = float(modal.replace('.', '').replace(',', ''))
+                self.data.modal = _parse_rupiah(modal)
             
             print("\n✅ Saldo awal berhasil diupdate!")
             
@@ -456,87 +549,132 @@ class BankFinancialReport:
         
         print(f"\n📊 Generating Excel report: {filename}...")
         
-        wb = Workbook()
+        from openpyxl import Workbook
+        self._ensure_styles()
+        
+        # Write-only: setiap sheet di-stream baris per baris saat append,
+        # tanpa menyimpan seluruh cell di memori
+        wb = Workbook(write_only=True)
+        for style in self.named_styles:
+            wb.add_named_style(style)
+        
+        totals = self._compute_totals()
+        period = self.data.period or datetime.now().strftime("%B %Y")
         
         # Sheet 1: Cover
-        self._create_cover_sheet(wb)
+        self._create_cover_sheet(wb, totals, period)
         
         # Sheet 2: Jurnal Transaksi
         self._create_journal_sheet(wb)
         
         # Sheet 3: Neraca
-        self._create_neraca_sheet(wb)
+        self._create_neraca_sheet(wb, totals, period)
         
         # Sheet 4: Laba Rugi
-        self._create_laba_rugi_sheet(wb)
+        self._create_laba_rugi_sheet(wb, totals, period)
         
         # Sheet 5: Arus Kas
-        self._create_arus_kas_sheet(wb)
+        self._create_arus_kas_sheet(wb, period)
         
-        # Save workbook
-        wb.save(filename)
+        # Save workbook - lewat buffer besar agar zip ditulis dengan sedikit syscall
+        with open(filename, 'wb', buffering=_SAVE_BUFFER_SIZE) as f:
+            wb.save(f)
         print(f"✅ Laporan berhasil disimpan: {filename}")
         
         return filename
     
-    def _create_cover_sheet(self, wb: Workbook):
+    def _cell(self, ws, value, style: str = None, font: Font = None,
+              fill: PatternFill = None, alignment: Alignment = None,
+              number_format: str = None) -> WriteOnlyCell:
+        """Buat cell write-only beserta style-nya untuk di-append ke sheet"""
+        cell = self._new_cell(ws, value=value)
+        if style is not None:
+            cell.style = style
+        if font is not None:
+            cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        if alignment is not None:
+            cell.alignment = alignment
+        if number_format is not None:
+            cell.number_format = number_format
+        return cell
+    
+    def _set_widths(self, ws, widths: Dict[str, float]):
+        """Set lebar kolom sheet dari dict {huruf kolom: lebar}"""
+        dims = ws.column_dimensions
+        for col, width in widths.items():
+            dims[col].width = width
+    
+    def _apply_merges(self, ws, merges: List[str]):
+        """Daftarkan semua merge range sheet sekaligus di akhir pembuatan sheet"""
+        from openpyxl.worksheet.cell_range import MultiCellRange
+        
+        # Dibangun sekali dari set, tanpa cek tumpang-tindih per add()
+        ws.merged_cells = MultiCellRange(' '.join(merges))
+    
+    def _create_cover_sheet(self, wb: Workbook, totals: Totals, period: str):
         """Create cover sheet"""
-        ws = wb.active
-        ws.title = "Cover"
+        ws = wb.create_sheet("Cover")
         ws.sheet_view.showGridLines = False
+        merges = []
         
         bank_name = self.data.bank_name or "BANK ANDA"
-        period = self.data.period or datetime.now().strftime("%B %Y")
         
-        # Title
-        ws.merge_cells('B3:G3')
-        ws['B3'] = "LAPORAN KEUANGAN"
-        ws['B3'].font = Font(size=24, bold=True, color=self.header_dark_blue)
-        ws['B3'].alignment = self.center_align
+        # Set column widths (write-only: harus sebelum baris pertama)
+        self._set_widths(ws, {'A': 3, 'B': 20, 'C': 3, 'D': 45, 'E': 20, 'F': 3, 'G': 3})
         ws.row_dimensions[3].height = 35
-        
-        ws.merge_cells('B4:G4')
-        ws['B4'] = bank_name.upper()
-        ws['B4'].font = Font(size=20, bold=True, color=self.header_light_blue)
-        ws['B4'].alignment = self.center_align
         ws.row_dimensions[4].height = 30
         
-        ws.merge_cells('B5:G5')
-        ws['B5'] = f"Periode: {period}"
-        ws['B5'].font = Font(size=14, color="666666")
-        ws['B5'].alignment = self.center_align
+        ws.append([])
+        ws.append([])
+        
+        # Title
+        merges.append('B3:G3')
+        ws.append([None, self._cell(ws, "LAPORAN KEUANGAN",
+                                    font=self.cover_title_font,
+                                    alignment=self.center_align)])
+        
+        merges.append('B4:G4')
+        ws.append([None, self._cell(ws, bank_name.upper(),
+                                    font=self.cover_bank_font,
+                                    alignment=self.center_align)])
+        
+        merges.append('B5:G5')
+        ws.append([None, self._cell(ws, f"Periode: {period}",
+                                    font=self.cover_period_font,
+                                    alignment=self.center_align)])
+        
+        ws.append([])
+        ws.append([])
         
         # Key Metrics
-        ws['B8'] = "RINGKASAN KEUANGAN"
-        ws['B8'].font = self.subtitle_font
+        ws.append([None, self._cell(ws, "RINGKASAN KEUANGAN", font=self.subtitle_font)])
+        ws.append([])
         
         metrics = [
-            ("Total Aset", self._get_total_aset()),
-            ("Total Kewajiban", self._get_total_kewajiban()),
-            ("Total Ekuitas", self._get_total_ekuitas()),
-            ("Laba/Rugi Bersih", self._get_laba_rugi()),
+            ("Total Aset", totals.aset),
+            ("Total Kewajiban", totals.kewajiban),
+            ("Total Ekuitas", totals.ekuitas),
+            ("Laba/Rugi Bersih", totals.laba_rugi),
             ("Saldo Kas", self.data.kas),
             ("Saldo Bank", self.data.bank_account),
         ]
         
-        row = 10
         for label, value in metrics:
-            ws[f'B{row}'] = label
-            ws[f'B{row}'].font = self.normal_font
-            ws[f'E{row}'] = value
-            ws[f'E{row}'].number_format = 'Rp #,##0.00'
-            ws[f'E{row}'].font = Font(bold=True, size=11)
-            ws[f'E{row}'].alignment = self.right_align
-            
-            if value >= 0:
-                ws[f'E{row}'].font = Font(bold=True, size=11, color=self.positive_green)
-            else:
-                ws[f'E{row}'].font = Font(bold=True, size=11, color=self.negative_red)
-            row += 1
+            ws.append([
+                None,
+                self._cell(ws, label, font=self.normal_font),
+                None,
+                None,
+                self._cell(ws, value, style='currency_pos' if value >= 0 else 'currency_neg'),
+            ])
         
         # Sheet Index
-        ws[f'B{row+2}'] = "DAFTAR ISI"
-        ws[f'B{row+2}'].font = self.subtitle_font
+        ws.append([])
+        ws.append([])
+        ws.append([None, self._cell(ws, "DAFTAR ISI", font=self.subtitle_font)])
+        ws.append([])
         
         sheets = [
             ("Jurnal Transaksi", "Daftar semua transaksi yang tercatat"),
@@ -545,115 +683,134 @@ class BankFinancialReport:
             ("Arus Kas", "Laporan arus kas masuk dan keluar"),
         ]
         
-        idx_row = row + 4
         for sheet_name, desc in sheets:
-            ws[f'B{idx_row}'] = sheet_name
-            ws[f'B{idx_row}'].font = Font(bold=True, size=10)
-            ws[f'D{idx_row}'] = desc
-            ws[f'D{idx_row}'].font = self.normal_font
-            idx_row += 1
-        
-        # Set column widths
-        ws.column_dimensions['A'].width = 3
-        ws.column_dimensions['B'].width = 20
-        ws.column_dimensions['C'].width = 3
-        ws.column_dimensions['D'].width = 45
-        ws.column_dimensions['E'].width = 20
-        ws.column_dimensions['F'].width = 3
-        ws.column_dimensions['G'].width = 3
+            ws.append([
+                None,
+                self._cell(ws, sheet_name, font=self.toc_font),
+                None,
+                self._cell(ws, desc, font=self.normal_font),
+            ])
+        
+        self._apply_merges(ws, merges)
     
     def _create_journal_sheet(self, wb: Workbook):
         """Create jurnal transaksi sheet"""
+        from openpyxl.worksheet.filters import AutoFilter
+        from openpyxl.worksheet.table import Table, TableColumn, TableStyleInfo
+        
         ws = wb.create_sheet("Jurnal Transaksi")
         ws.sheet_view.showGridLines = False
+        merges = []
         
-        # Title
-        ws.merge_cells('B2:I2')
-        ws['B2'] = "JURNAL TRANSAKSI"
-        ws['B2'].font = self.title_font
-        ws['B2'].alignment = self.left_align
+        # Set column widths (write-only: harus sebelum baris pertama)
+        self._set_widths(ws, {'A': 3, 'B': 5, 'C': 12, 'D': 20, 'E': 25,
+                              'F': 18, 'G': 18, 'H': 18, 'I': 15})
         ws.row_dimensions[2].height = 30
         
+        ws.append([])
+        
+        # Title
+        merges.append('B2:I2')
+        ws.append([None, self._cell(ws, "JURNAL TRANSAKSI",
+                                    font=self.title_font, alignment=self.left_align)])
+        ws.append([])
+        
         # Headers
-        headers = ['No', 'Tanggal', 'Jenis Transaksi', 'Keterangan', 
+        headers = ['No', 'Tanggal', 'Jenis Transaksi', 'Keterangan',
                    'Akun Debit', 'Akun Kredit', 'Nominal', 'Referensi']
         
-        for col, header in enumerate(headers, start=2):
-            cell = ws.cell(row=4, column=col, value=header)
-            cell.fill = self.header_fill
-            cell.font = self.header_font
-            cell.alignment = self.center_align
-            cell.border = self.thin_border
+        ws.append([None] + [
+            self._cell(ws, header, style='header')
+            for header in headers
+        ])
         
         # Data
         row = 5
+        total = 0.0
         for t in self.data.transactions:
-            ws.cell(row=row, column=2, value=t.id).border = self.thin_border
-            ws.cell(row=row, column=3, value=t.date).border = self.thin_border
-            ws.cell(row=row, column=4, value=t.transaction_type.value).border = self.thin_border
-            ws.cell(row=row, column=5, value=t.description).border = self.thin_border
-            ws.cell(row=row, column=6, value=t.account_debit).border = self.thin_border
-            ws.cell(row=row, column=7, value=t.account_credit).border = self.thin_border
-            
-            nominal_cell = ws.cell(row=row, column=8, value=t.amount)
-            nominal_cell.number_format = 'Rp #,##0.00'
-            nominal_cell.border = self.thin_border
-            nominal_cell.alignment = self.right_align
-            
-            ws.cell(row=row, column=9, value=t.reference).border = self.thin_border
-            
-            # Alternating row color
-            if row % 2 == 0:
-                for col in range(2, 10):
-                    ws.cell(row=row, column=col).fill = self.alt_row_fill
+            # Garis & warna baris dari table style; hanya nominal yang butuh cell ber-style
+            ws.append([
+                None, t.id, t.date, t.transaction_type.value, t.description,
+                t.account_debit, t.account_credit,
+                self._cell(ws, t.amount, alignment=self.right_align,
+                           number_format='Rp #,##0.00'),
+                t.reference,
+            ])
             
+            total += t.amount
             row += 1
         
-        # Total
-        ws.merge_cells(f'B{row}:G{row}')
-        ws[f'B{row}'] = "TOTAL"
-        ws[f'B{row}'].font = Font(bold=True)
-        ws[f'B{row}'].alignment = self.right_align
-        
-        total_formula = f"=SUM(H5:H{row-1})"
-        total_cell = ws[f'H{row}']
-        total_cell.value = total_formula
-        total_cell.number_format = 'Rp #,##0.00'
-        total_cell.font = Font(bold=True)
-        total_cell.fill = self.highlight_fill
-        
-        # Set column widths
-        ws.column_dimensions['A'].width = 3
-        ws.column_dimensions['B'].width = 5
-        ws.column_dimensions['C'].width = 12
-        ws.column_dimensions['D'].width = 20
-        ws.column_dimensions['E'].width = 25
-        ws.column_dimensions['F'].width = 18
-        ws.column_dimensions['G'].width = 18
-        ws.column_dimensions['H'].width = 18
-        ws.column_dimensions['I'].width = 15
+        # Alternating row color lewat table style, bukan fill per cell
+        if self.data.transactions:
+            table = Table(displayName="Jurnal", ref=f"B4:I{row-1}")
+            table.tableStyleInfo = TableStyleInfo(name="TableStyleMedium9", showRowStripes=True)
+            table.tableColumns = [TableColumn(id=idx, name=header)
+                                  for idx, header in enumerate(headers, start=1)]
+            table.autoFilter = AutoFilter(ref=table.ref)
+            # Kolom sudah diisi manual; redam hanya warning write-only agar
+            # cek nama tabel duplikat di add_table() tetap berjalan
+            with warnings.catch_warnings():
+                warnings.filterwarnings(
+                    "ignore", message="In write-only mode you must add table columns manually")
+                ws.add_table(table)
+        
+        # Total (dihitung di Python, write-only tidak bisa menulis balik ke atas)
+        merges.append(f'B{row}:G{row}')
+        ws.append([
+            None,
+            self._cell(ws, "TOTAL", font=self.total_font, alignment=self.right_align),
+            None, None, None, None, None,
+            self._cell(ws, total, style='total_highlight'),
+        ])
+        
+        self._apply_merges(ws, merges)
+    
+    def _write_section(self, ws, merges: List[str], row: int, title: str,
+                       items: List[Tuple[str, float]], total_label: str, total_value: float,
+                       title_style: str = 'section', total_style: str = 'total_highlight') -> int:
+        """Tulis satu seksi laporan (judul, item, total) mulai dari baris row.
+        
+        Merge judul seksi ditambahkan ke merges; mengembalikan nomor baris
+        kosong berikutnya setelah baris total.
+        """
+        merges.append(f'B{row}:D{row}')
+        ws.append([None, self._cell(ws, title, style=title_style)])
+        
+        for label, value in items:
+            ws.append([
+                None,
+                self._cell(ws, f"  {label}", font=self.normal_font),
+                None,
+                self._cell(ws, value, style='currency'),
+            ])
+        
+        ws.append([
+            None,
+            self._cell(ws, total_label, font=self.total_font),
+            None,
+            self._cell(ws, total_value, style=total_style),
+        ])
+        return row + len(items) + 2
     
-    def _create_neraca_sheet(self, wb: Workbook):
+    def _create_neraca_sheet(self, wb: Workbook, totals: Totals, period: str):
         """Create neraca sheet"""
         ws = wb.create_sheet("Neraca")
         ws.sheet_view.showGridLines = False
+        merges = []
         
-        # Title
-        ws.merge_cells('B2:E2')
-        ws['B2'] = "NERACA (BALANCE SHEET)"
-        ws['B2'].font = self.title_font
+        # Set column widths (write-only: harus sebelum baris pertama)
+        self._set_widths(ws, {'A': 3, 'B': 30, 'C': 3, 'D': 25, 'E': 3})
         ws.row_dimensions[2].height = 30
         
-        period = self.data.period or datetime.now().strftime("%B %Y")
-        ws.merge_cells('B3:E3')
-        ws['B3'] = f"Periode: {period}"
-        ws['B3'].font = Font(size=11, color="666666")
+        ws.append([])
         
-        # ASET
-        ws['B5'] = "ASET"
-        ws['B5'].font = self.subtitle_font
-        ws['B5'].fill = self.subheader_fill
-        ws.merge_cells('B5:D5')
+        # Title
+        merges.append('B2:E2')
+        ws.append([None, self._cell(ws, "NERACA (BALANCE SHEET)", font=self.title_font)])
+        
+        merges.append('B3:E3')
+        ws.append([None, self._cell(ws, f"Periode: {period}", font=self.period_font)])
+        ws.append([])
         
         aset_items = [
             ("Kas", self.data.kas),
@@ -662,341 +819,186 @@ class BankFinancialReport:
             ("Investasi", self.data.investasi),
             ("Aset Lainnya", self.data.aset_lain),
         ]
-        
-        row = 6
-        for label, value in aset_items:
-            ws[f'B{row}'] = f"  {label}"
-            ws[f'B{row}'].font = self.normal_font
-            ws[f'D{row}'] = value
-            ws[f'D{row}'].number_format = 'Rp #,##0.00'
-            ws[f'D{row}'].alignment = self.right_align
-            row += 1
-        
-        # Total Aset
-        ws[f'B{row}'] = "TOTAL ASET"
-        ws[f'B{row}'].font = Font(bold=True, size=11)
-        ws[f'D{row}'] = self._get_total_aset()
-        ws[f'D{row}'].number_format = 'Rp #,##0.00'
-        ws[f'D{row}'].font = Font(bold=True, size=11)
-        ws[f'D{row}'].fill = self.highlight_fill
-        ws[f'D{row}'].alignment = self.right_align
-        
-        # KEWAJIBAN
-        row += 2
-        ws[f'B{row}'] = "KEWAJIBAN"
-        ws[f'B{row}'].font = self.subtitle_font
-        ws[f'B{row}'].fill = self.subheader_fill
-        ws.merge_cells(f'B{row}:D{row}')
+        row = self._write_section(ws, merges, 5, "ASET", aset_items, "TOTAL ASET", totals.aset)
         
         kewajiban_items = [
             ("Hutang", self.data.hutang),
             ("Pinjaman", self.data.pinjaman),
         ]
-        
-        row += 1
-        for label, value in kewajiban_items:
-            ws[f'B{row}'] = f"  {label}"
-            ws[f'B{row}'].font = self.normal_font
-            ws[f'D{row}'] = value
-            ws[f'D{row}'].number_format = 'Rp #,##0.00'
-            ws[f'D{row}'].alignment = self.right_align
-            row += 1
-        
-        ws[f'B{row}'] = "TOTAL KEWAJIBAN"
-        ws[f'B{row}'].font = Font(bold=True, size=11)
-        ws[f'D{row}'] = self._get_total_kewajiban()
-        ws[f'D{row}'].number_format = 'Rp #,##0.00'
-        ws[f'D{row}'].font = Font(bold=True, size=11)
-        ws[f'D{row}'].fill = self.highlight_fill
-        ws[f'D{row}'].alignment = self.right_align
-        
-        # EKUITAS
-        row += 2
-        ws[f'B{row}'] = "EKUITAS"
-        ws[f'B{row}'].font = self.subtitle_font
-        ws[f'B{row}'].fill = self.subheader_fill
-        ws.merge_cells(f'B{row}:D{row}')
+        ws.append([])
+        row = self._write_section(ws, merges, row + 1, "KEWAJIBAN", kewajiban_items,
+                                  "TOTAL KEWAJIBAN", totals.kewajiban)
         
         ekuitas_items = [
             ("Modal", self.data.modal),
             ("Laba Ditahan", self.data.laba_ditahan),
-            ("Laba/Rugi Berjalan", self._get_laba_rugi()),
+            ("Laba/Rugi Berjalan", totals.laba_rugi),
         ]
-        
-        row += 1
-        for label, value in ekuitas_items:
-            ws[f'B{row}'] = f"  {label}"
-            ws[f'B{row}'].font = self.normal_font
-            ws[f'D{row}'] = value
-            ws[f'D{row}'].number_format = 'Rp #,##0.00'
-            ws[f'D{row}'].alignment = self.right_align
-            row += 1
-        
-        ws[f'B{row}'] = "TOTAL EKUITAS"
-        ws[f'B{row}'].font = Font(bold=True, size=11)
-        ws[f'D{row}'] = self._get_total_ekuitas()
-        ws[f'D{row}'].number_format = 'Rp #,##0.00'
-        ws[f'D{row}'].font = Font(bold=True, size=11)
-        ws[f'D{row}'].fill = self.highlight_fill
-        ws[f'D{row}'].alignment = self.right_align
+        ws.append([])
+        row = self._write_section(ws, merges, row + 1, "EKUITAS", ekuitas_items,
+                                  "TOTAL EKUITAS", totals.ekuitas)
         
         # TOTAL KEWAJIBAN + EKUITAS
-        row += 1
-        ws[f'B{row}'] = "TOTAL KEWAJIBAN + EKUITAS"
-        ws[f'B{row}'].font = Font(bold=True, size=12)
-        ws[f'D{row}'] = self._get_total_kewajiban() + self._get_total_ekuitas()
-        ws[f'D{row}'].number_format = 'Rp #,##0.00'
-        ws[f'D{row}'].font = Font(bold=True, size=12, color=self.header_dark_blue)
-        ws[f'D{row}'].fill = PatternFill(start_color="D4E6F1", end_color="D4E6F1", fill_type="solid")
-        ws[f'D{row}'].alignment = self.right_align
+        total_passiva = totals.kewajiban + totals.ekuitas
+        ws.append([
+            None,
+            self._cell(ws, "TOTAL KEWAJIBAN + EKUITAS", font=self.grand_total_label_font),
+            None,
+            self._cell(ws, total_passiva, style='grand_total'),
+        ])
         
         # Verification
         row += 2
-        total_aset = self._get_total_aset()
-        total_passiva = self._get_total_kewajiban() + self._get_total_ekuitas()
+        ws.append([])
         
-        if abs(total_aset - total_passiva) < 0.01:
-            ws[f'B{row}'] = "✓ Neraca Seimbang (Aset = Kewajiban + Ekuitas)"
-            ws[f'B{row}'].font = Font(bold=True, color=self.positive_green)
+        if abs(totals.aset - total_passiva) < 0.01:
+            status = self._cell(ws, "✓ Neraca Seimbang (Aset = Kewajiban + Ekuitas)",
+                                font=self.status_ok_font)
         else:
-            ws[f'B{row}'] = f"✗ Neraca Tidak Seimbang (Selisih: Rp {abs(total_aset - total_passiva):,.2f})"
-            ws[f'B{row}'].font = Font(bold=True, color=self.negative_red)
+            status = self._cell(ws, f"✗ Neraca Tidak Seimbang (Selisih: Rp {abs(totals.aset - total_passiva):,.2f})",
+                                font=self.status_error_font)
         
-        ws.merge_cells(f'B{row}:E{row}')
+        merges.append(f'B{row}:E{row}')
+        ws.append([None, status])
         
-        # Set column widths
-        ws.column_dimensions['A'].width = 3
-        ws.column_dimensions['B'].width = 30
-        ws.column_dimensions['C'].width = 3
-        ws.column_dimensions['D'].width = 25
-        ws.column_dimensions['E'].width = 3
+        self._apply_merges(ws, merges)
     
-    def _create_laba_rugi_sheet(self, wb: Workbook):
+    def _create_laba_rugi_sheet(self, wb: Workbook, totals: Totals, period: str):
         """Create laba rugi sheet"""
         ws = wb.create_sheet("Laba Rugi")
         ws.sheet_view.showGridLines = False
+        merges = []
         
-        # Title
-        ws.merge_cells('B2:E2')
-        ws['B2'] = "LAPORAN LABA RUGI"
-        ws['B2'].font = self.title_font
+        # Set column widths (write-only: harus sebelum baris pertama)
+        self._set_widths(ws, {'A': 3, 'B': 30, 'C': 3, 'D': 25, 'E': 3})
         ws.row_dimensions[2].height = 30
         
-        period = self.data.period or datetime.now().strftime("%B %Y")
-        ws.merge_cells('B3:E3')
-        ws['B3'] = f"Periode: {period}"
-        ws['B3'].font = Font(size=11, color="666666")
+        ws.append([])
+        
+        # Title
+        merges.append('B2:E2')
+        ws.append([None, self._cell(ws, "LAPORAN LABA RUGI", font=self.title_font)])
         
-        # PENDAPATAN
-        ws['B5'] = "PENDAPATAN"
-        ws['B5'].font = self.subtitle_font
-        ws['B5'].fill = self.subheader_fill
-        ws.merge_cells('B5:D5')
+        merges.append('B3:E3')
+        ws.append([None, self._cell(ws, f"Periode: {period}", font=self.period_font)])
+        ws.append([])
         
         pendapatan_items = [
             ("Pendapatan Bunga", self.data.pendapatan_bunga),
             ("Pendapatan Lainnya", self.data.pendapatan_lain),
         ]
-        
-        row = 6
-        for label, value in pendapatan_items:
-            ws[f'B{row}'] = f"  {label}"
-            ws[f'B{row}'].font = self.normal_font
-            ws[f'D{row}'] = value
-            ws[f'D{row}'].number_format = 'Rp #,##0.00'
-            ws[f'D{row}'].alignment = self.right_align
-            row += 1
-        
-        ws[f'B{row}'] = "TOTAL PENDAPATAN"
-        ws[f'B{row}'].font = Font(bold=True, size=11)
-        ws[f'D{row}'] = self._get_total_pendapatan()
-        ws[f'D{row}'].number_format = 'Rp #,##0.00'
-        ws[f'D{row}'].font = Font(bold=True, size=11, color=self.positive_green)
-        ws[f'D{row}'].fill = self.highlight_fill
-        ws[f'D{row}'].alignment = self.right_align
-        
-        # BEBAN
-        row += 2
-        ws[f'B{row}'] = "BEBAN"
-        ws[f'B{row}'].font = self.subtitle_font
-        ws[f'B{row}'].fill = PatternFill(start_color="E74C3C", end_color="E74C3C", fill_type="solid")
-        ws.merge_cells(f'B{row}:D{row}')
+        row = self._write_section(ws, merges, 5, "PENDAPATAN", pendapatan_items,
+                                  "TOTAL PENDAPATAN", totals.pendapatan,
+                                  total_style='total_highlight_pos')
         
         beban_items = [
             ("Beban Administrasi", self.data.beban_admin),
             ("Beban Lainnya", self.data.beban_lain),
         ]
-        
-        row += 1
-        for label, value in beban_items:
-            ws[f'B{row}'] = f"  {label}"
-            ws[f'B{row}'].font = self.normal_font
-            ws[f'D{row}'] = value
-            ws[f'D{row}'].number_format = 'Rp #,##0.00'
-            ws[f'D{row}'].alignment = self.right_align
-            row += 1
-        
-        ws[f'B{row}'] = "TOTAL BEBAN"
-        ws[f'B{row}'].font = Font(bold=True, size=11)
-        ws[f'D{row}'] = self._get_total_beban()
-        ws[f'D{row}'].number_format = 'Rp #,##0.00'
-        ws[f'D{row}'].font = Font(bold=True, size=11, color=self.negative_red)
-        ws[f'D{row}'].fill = self.highlight_fill
-        ws[f'D{row}'].alignment = self.right_align
+        ws.append([])
+        row = self._write_section(ws, merges, row + 1, "BEBAN", beban_items,
+                                  "TOTAL BEBAN", totals.beban,
+                                  title_style='section_beban', total_style='total_highlight_neg')
         
         # LABA/RUGI BERSIH
-        row += 2
-        ws[f'B{row}'] = "LABA/RUGI BERSIH"
-        ws[f'B{row}'].font = Font(bold=True, size=12)
-        laba_rugi = self._get_laba_rugi()
-        ws[f'D{row}'] = laba_rugi
-        ws[f'D{row}'].number_format = 'Rp #,##0.00'
+        ws.append([])
+        laba_rugi = totals.laba_rugi
         
         if laba_rugi >= 0:
-            ws[f'D{row}'].font = Font(bold=True, size=12, color=self.positive_green)
-            ws[f'B{row+1}'] = "✓ Periode ini menghasilkan LABA"
+            laba_style = 'net_pos'
+            keterangan = "✓ Periode ini menghasilkan LABA"
         else:
-            ws[f'D{row}'].font = Font(bold=True, size=12, color=self.negative_red)
-            ws[f'B{row+1}'] = "✗ Periode ini mengalami RUGI"
+            laba_style = 'net_neg'
+            keterangan = "✗ Periode ini mengalami RUGI"
         
-        ws[f'D{row}'].fill = PatternFill(start_color="D5F5E3", end_color="D5F5E3", fill_type="solid")
-        ws[f'D{row}'].alignment = self.right_align
+        ws.append([
+            None,
+            self._cell(ws, "LABA/RUGI BERSIH", font=self.grand_total_label_font),
+            None,
+            self._cell(ws, laba_rugi, style=laba_style),
+        ])
         
-        ws[f'B{row+1}'].font = Font(italic=True, size=10)
-        ws.merge_cells(f'B{row+1}:D{row+1}')
+        merges.append(f'B{row+2}:D{row+2}')
+        ws.append([None, self._cell(ws, keterangan, font=self.note_font)])
         
-        # Set column widths
-        ws.column_dimensions['A'].width = 3
-        ws.column_dimensions['B'].width = 30
-        ws.column_dimensions['C'].width = 3
-        ws.column_dimensions['D'].width = 25
-        ws.column_dimensions['E'].width = 3
+        self._apply_merges(ws, merges)
     
-    def _create_arus_kas_sheet(self, wb: Workbook):
+    def _create_arus_kas_sheet(self, wb: Workbook, period: str):
         """Create arus kas sheet"""
         ws = wb.create_sheet("Arus Kas")
         ws.sheet_view.showGridLines = False
+        merges = []
         
-        # Title
-        ws.merge_cells('B2:E2')
-        ws['B2'] = "LAPORAN ARUS KAS"
-        ws['B2'].font = self.title_font
+        # Set column widths (write-only: harus sebelum baris pertama)
+        self._set_widths(ws, {'A': 3, 'B': 35, 'C': 3, 'D': 25, 'E': 3})
         ws.row_dimensions[2].height = 30
         
-        period = self.data.period or datetime.now().strftime("%B %Y")
-        ws.merge_cells('B3:E3')
-        ws['B3'] = f"Periode: {period}"
-        ws['B3'].font = Font(size=11, color="666666")
+        ws.append([])
+        
+        # Title
+        merges.append('B2:E2')
+        ws.append([None, self._cell(ws, "LAPORAN ARUS KAS", font=self.title_font)])
         
-        # ARUS KAS DARI AKTIVITAS OPERASI
-        ws['B5'] = "ARUS KAS DARI AKTIVITAS OPERASI"
-        ws['B5'].font = self.subtitle_font
-        ws['B5'].fill = self.subheader_fill
-        ws.merge_cells('B5:D5')
+        merges.append('B3:E3')
+        ws.append([None, self._cell(ws, f"Periode: {period}", font=self.period_font)])
+        ws.append([])
         
         operasi_items = [
             ("Penerimaan dari pelanggan", self.data.pendapatan_lain),
             ("Pembayaran beban operasional", -self.data.beban_lain),
             ("Pembayaran biaya administrasi", -self.data.beban_admin),
         ]
+        kas_operasi = self.data.pendapatan_lain - self.data.beban_lain - self.data.beban_admin
+        row = self._write_section(ws, merges, 5, "ARUS KAS DARI AKTIVITAS OPERASI", operasi_items,
+                                  "Kas Bersih dari Operasi", kas_operasi)
         
-        row = 6
-        for label, value in operasi_items:
-            ws[f'B{row}'] = f"  {label}"
-            ws[f'B{row}'].font = self.normal_font
-            ws[f'D{row}'] = value
-            ws[f'D{row}'].number_format = 'Rp #,##0.00'
-            ws[f'D{row}'].alignment = self.right_align
-            row += 1
-        
-        ws[f'B{row}'] = "Kas Bersih dari Operasi"
-        ws[f'B{row}'].font = Font(bold=True, size=11)
-        kas_operasi = sum(v for _, v in operasi_items)
-        ws[f'D{row}'] = kas_operasi
-        ws[f'D{row}'].number_format = 'Rp #,##0.00'
-        ws[f'D{row}'].font = Font(bold=True, size=11)
-        ws[f'D{row}'].fill = self.highlight_fill
-        ws[f'D{row}'].alignment = self.right_align
-        
-        # ARUS KAS DARI AKTIVITAS INVESTASI
-        row += 2
-        ws[f'B{row}'] = "ARUS KAS DARI AKTIVITAS INVESTASI"
-        ws[f'B{row}'].font = self.subtitle_font
-        ws[f'B{row}'].fill = self.subheader_fill
-        ws.merge_cells(f'B{row}:D{row}')
-        
-        row += 1
-        ws[f'B{row}'] = "  Pembelian investasi"
-        ws[f'B{row}'].font = self.normal_font
-        ws[f'D{row}'] = -self.data.investasi
-        ws[f'D{row}'].number_format = 'Rp #,##0.00'
-        ws[f'D{row}'].alignment = self.right_align
-        
-        row += 1
-        ws[f'B{row}'] = "  Penerimaan bunga"
-        ws[f'B{row}'].font = self.normal_font
-        ws[f'D{row}'] = self.data.pendapatan_bunga
-        ws[f'D{row}'].number_format = 'Rp #,##0.00'
-        ws[f'D{row}'].alignment = self.right_align
-        
-        row += 1
-        ws[f'B{row}'] = "Kas Bersih dari Investasi"
-        ws[f'B{row}'].font = Font(bold=True, size=11)
+        investasi_items = [
+            ("Pembelian investasi", -self.data.investasi),
+            ("Penerimaan bunga", self.data.pendapatan_bunga),
+        ]
         kas_investasi = self.data.pendapatan_bunga - self.data.investasi
-        ws[f'D{row}'] = kas_investasi
-        ws[f'D{row}'].number_format = 'Rp #,##0.00'
-        ws[f'D{row}'].font = Font(bold=True, size=11)
-        ws[f'D{row}'].fill = self.highlight_fill
-        ws[f'D{row}'].alignment = self.right_align
-        
-        # ARUS KAS DARI AKTIVITAS PENDANAAN
-        row += 2
-        ws[f'B{row}'] = "ARUS KAS DARI AKTIVITAS PENDANAAN"
-        ws[f'B{row}'].font = self.subtitle_font
-        ws[f'B{row}'].fill = self.subheader_fill
-        ws.merge_cells(f'B{row}:D{row}')
+        ws.append([])
+        row = self._write_section(ws, merges, row + 1, "ARUS KAS DARI AKTIVITAS INVESTASI", investasi_items,
+                                  "Kas Bersih dari Investasi", kas_investasi)
         
         pendanaan_items = [
-            ("  Setoran modal", self.data.modal),
-            ("  Penerimaan pinjaman", self.data.pinjaman),
-            ("  Pembayaran hutang", -self.data.hutang),
+            ("Setoran modal", self.data.modal),
+            ("Penerimaan pinjaman", self.data.pinjaman),
+            ("Pembayaran hutang", -self.data.hutang),
         ]
-        
-        row += 1
-        for label, value in pendanaan_items:
-            ws[f'B{row}'] = label
-            ws[f'B{row}'].font = self.normal_font
-            ws[f'D{row}'] = value
-            ws[f'D{row}'].number_format = 'Rp #,##0.00'
-            ws[f'D{row}'].alignment = self.right_align
-            row += 1
-        
-        ws[f'B{row}'] = "Kas Bersih dari Pendanaan"
-        ws[f'B{row}'].font = Font(bold=True, size=11)
-        kas_pendanaan = sum(v for _, v in pendanaan_items)
-        ws[f'D{row}'] = kas_pendanaan
-        ws[f'D{row}'].number_format = 'Rp #,##0.00'
-        ws[f'D{row}'].font = Font(bold=True, size=11)
-        ws[f'D{row}'].fill = self.highlight_fill
-        ws[f'D{row}'].alignment = self.right_align
+        kas_pendanaan = self.data.modal + self.data.pinjaman - self.data.hutang
+        ws.append([])
+        row = self._write_section(ws, merges, row + 1, "ARUS KAS DARI AKTIVITAS PENDANAAN", pendanaan_items,
+                                  "Kas Bersih dari Pendanaan", kas_pendanaan)
         
         # KENAIKAN/PENURUNAN KAS BERSIH
-        row += 2
-        ws[f'B{row}'] = "KENAIKAN/PENURUNAN KAS BERSIH"
-        ws[f'B{row}'].font = Font(bold=True, size=12)
+        ws.append([])
         total_arus_kas = kas_operasi + kas_investasi + kas_pendanaan
-        ws[f'D{row}'] = total_arus_kas
-        ws[f'D{row}'].number_format = 'Rp #,##0.00'
-        ws[f'D{row}'].font = Font(bold=True, size=12, color=self.header_dark_blue)
-        ws[f'D{row}'].fill = PatternFill(start_color="D4E6F1", end_color="D4E6F1", fill_type="solid")
-        ws[f'D{row}'].alignment = self.right_align
-        
-        # Set column widths
-        ws.column_dimensions['A'].width = 3
-        ws.column_dimensions['B'].width = 35
-        ws.column_dimensions['C'].width = 3
-        ws.column_dimensions['D'].width = 25
-        ws.column_dimensions['E'].width = 3
+        ws.append([
+            None,
+            self._cell(ws, "KENAIKAN/PENURUNAN KAS BERSIH", font=self.grand_total_label_font),
+            None,
+            self._cell(ws, total_arus_kas, style='grand_total'),
+        ])
+        
+        self._apply_merges(ws, merges)
+    
+    def _compute_totals(self) -> Totals:
+        """Hitung semua total laporan sekali untuk dipakai semua sheet.
+        
+        Laba/rugi = pendapatan - beban; ekuitas = modal + laba ditahan + laba/rugi.
+        """
+        pendapatan = self._get_total_pendapatan()
+        beban = self._get_total_beban()
+        laba_rugi = pendapatan - beban
+        return Totals(
+            aset=self._get_total_aset(),
+            kewajiban=self._get_total_kewajiban(),
+            ekuitas=self.data.modal + self.data.laba_ditahan + laba_rugi,
+            pendapatan=pendapatan,
+            beban=beban,
+            laba_rugi=laba_rugi,
+        )
     
     def _get_total_aset(self) -> float:
         """Hitung total aset"""
@@ -1006,10 +1008,6 @@ class BankFinancialReport:
         """Hitung total kewajiban"""
         return self.data.hutang + self.data.pinjaman
     
-    def _get_total_ekuitas(self) -> float:
-        """Hitung total ekuitas"""
-        return self.data.modal + self.data.laba_ditahan + self._get_laba_rugi()
-    
     def _get_total_pendapatan(self) -> float:
         """Hitung total pendapatan"""
         return self.data.pendapatan_bunga + self.data.pendapatan_lain
@@ -1018,9 +1016,20 @@ class BankFinancialReport:
         """Hitung total beban"""
         return self.data.beban_admin + self.data.beban_lain
     
-    def _get_laba_rugi(self) -> float:
-        """Hitung laba/rugi bersih"""
-        return self._get_total_pendapatan() - self._get_total_beban()
+    def _exit(self):
+        """Keluar dari aplikasi"""
+        print("\n👋 Terima kasih telah menggunakan Bank Financial Report CLI!")
+        sys.exit(0)
+    
+    def _generate_report_prompt(self):
+        """Tanya nama file lalu generate laporan Excel"""
+        filename = input("Nama file output [default: auto]: ").strip()
+        if not filename:
+            filename = None
+        else:
+            if not filename.endswith('.xlsx'):
+                filename += '.xlsx'
+        self.generate_excel_report(filename)
     
     def run_interactive(self):
         """Run aplikasi dalam mode interaktif"""
@@ -1037,29 +1046,9 @@ class BankFinancialReport:
             try:
                 choice = input("Pilih menu [0-7]: ").strip()
                 
-                if choice == '0':
-                    print("\n👋 Terima kasih telah menggunakan Bank Financial Report CLI!")
-                    sys.exit(0)
-                elif choice == '1':
-                    self.input_transaction()
-                elif choice == '2':
-                    self.view_transactions()
-                elif choice == '3':
-                    self.edit_transaction()
-                elif choice == '4':
-                    self.delete_transaction()
-                elif choice == '5':
-                    self.set_initial_balance()
-                elif choice == '6':
-                    filename = input("Nama file output [default: auto]: ").strip()
-                    if not filename:
-                        filename = None
-                    else:
-                        if not filename.endswith('.xlsx'):
-                            filename += '.xlsx'
-                    self.generate_excel_report(filename)
-                elif choice == '7':
-                    self.set_bank_info()
+                handler = self._actions.get(choice)
+                if handler:
+                    handler()
                 else:
                     print("❌ Pilihan tidak valid!")
                 
@@ -1070,8 +1059,21 @@ class BankFinancialReport:
                 sys.exit(0)
 
 
+# Transaksi demo: (tanggal, jenis, keterangan, akun debit, akun kredit, nominal)
+_DEMO_TRANSACTIONS = (
+    ("2024-01-05", TransactionType.SETORAN_TUNAI, "Setoran Modal Awal", "Kas", "Modal", 100000000),
+    ("2024-01-10", TransactionType.BUNGA_MASUK, "Bunga Deposito", "Bank", "Pendapatan Bunga", 2500000),
+    ("2024-01-15", TransactionType.PEMBELIAN, "Pembelian Obligasi", "Investasi", "Bank", 50000000),
+    ("2024-01-20", TransactionType.BIAYA_ADMIN, "Biaya Admin Bulanan", "Beban Administrasi", "Bank", 150000),
+    ("2024-01-25", TransactionType.TRANSFER_MASUK, "Penerimaan Transfer", "Bank", "Pendapatan", 15000000),
+)
+
+
 def main():
     """Main entry point"""
+    # argparse hanya dibutuhkan saat dijalankan sebagai CLI, bukan saat modul di-import
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='Bank Financial Report CLI Tool - Laporan Keuangan Bank dengan Integrasi Excel',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1080,6 +1082,7 @@ Contoh Penggunaan:
   %(prog)s                          # Jalankan mode interaktif
   %(prog)s --output laporan.xlsx    # Generate laporan dengan nama file custom
   %(prog)s --demo                   # Jalankan dengan data demo
+  %(prog)s --demo -o demo.xlsx      # Generate laporan data demo tanpa menu
 
 Author: Financial CLI Tools
 Version: 1.0.0
@@ -1108,17 +1111,9 @@ Version: 1.0.0
         app.data.pinjaman = 75000000
         
         # Add demo transactions
-        demo_trans = [
-            ("2024-01-05", TransactionType.SETORAN_TUNAI, "Setoran Modal Awal", "Kas", "Modal", 100000000),
-            ("2024-01-10", TransactionType.BUNGA_MASUK, "Bunga Deposito", "Bank", "Pendapatan Bunga", 2500000),
-            ("2024-01-15", TransactionType.PEMBELIAN, "Pembelian Obligasi", "Investasi", "Bank", 50000000),
-            ("2024-01-20", TransactionType.BIAYA_ADMIN, "Biaya Admin Bulanan", "Beban Administrasi", "Bank", 150000),
-            ("2024-01-25", TransactionType.TRANSFER_MASUK, "Penerimaan Transfer", "Bank", "Pendapatan", 15000000),
-        ]
-        
-        for i, (date, t_type, desc, acc_d, acc_c, amount) in enumerate(demo_trans, 1):
+        for date, t_type, desc, acc_d, acc_c, amount in _DEMO_TRANSACTIONS:
             app.transaction_counter += 1
-            app.data.transactions.append(Transaction(
+            app.add_transaction(Transaction(
                 id=app.transaction_counter,
                 date=date,
                 description=desc,
@@ -1129,7 +1124,11 @@ Version: 1.0.0
             ))
         
         print("✅ Data demo berhasil dimuat!")
-        app.run_interactive()
+        if args.output:
+            # Tanpa menu: langsung generate laporan dari data demo
+            app.generate_excel_report(args.output)
+        else:
+            app.run_interactive()
     elif args.output:
         app.generate_excel_report(args.output)
     else: